@@ -1,16 +1,35 @@
 #!/usr/bin/env python3
 
-import argparse, os
+import argparse, string
 from scripts.info.tool_info import TOOL_INFO
 from scripts.info.compatibility_table import compatibility_table
 from scripts import rot, subst, atbash, vigenere, railfence, columnar, numval
 
 
+# Maps each flag to whether it selects a tool or an operation, built once so the detection only needs dict lookups
+FLAG_CATEGORY = dict.fromkeys(TOOL_INFO, "tool")
+FLAG_CATEGORY.update(dict.fromkeys(["encrypt", "decrypt", "bruteforce", "generate", "info"], "operation"))
+
+# Operations supported by each tool as sets, for the compatibility check. TOOL_INFO keeps them as ordered lists for the GUI menus
+TOOL_OPERATIONS = {tool: frozenset(info["operations"]) for tool, info in TOOL_INFO.items()}
+
+# Maps each tool to the function that runs it, called as (text, key, operation). Tools without a key are wrapped so they ignore it
+TOOL_FUNCTIONS = {
+    "rot": rot.rot,
+    "subst": subst.subst,
+    "atbash": lambda text, key, operation: atbash.atbash(text=text, operation=operation),
+    "vigenere": vigenere.vigenere,
+    "railfence": railfence.railfence,
+    "columnar": columnar.columnar,
+    "numval": lambda text, key, operation: numval.numval(text=text, operation=operation)
+}
+
+
 # --------------------------------------------------------------------------------------------------------------
 # ---------------------------------------- ARGUMENT PARSER ----------------------------------------
 # --------------------------------------------------------------------------------------------------------------
 
-def argument_parser():
+def build_parser():
 
     # ---------------- CREATE THE PARSER ----------------
 
@@ -61,48 +80,86 @@ def argument_parser():
     input_group.add_argument("-t", "--text", help="String or file to be encrypted or decrypted", dest="text")
     input_group.add_argument("-k", "--key", help="String or file used as a key for encryption or decryption if needed", dest="key")
 
+    return parser
+
+
+# The parser is built once when the module is loaded, so each run only has to parse the arguments
+PARSER = build_parser()
+
+
+def load_input(value):
+
+    import os, stat     # Only needed when reading files
+
+    # Read from file if it is a regular file, else treat as direct string input.
+    # Values with line breaks or longer than a path can be are never file names, so we don't even try to open them
+    if "\n" in value or len(value) >= 4096:
+        return value.strip()
+
+    # Open without blocking, so FIFOs and devices don't hang before we can check what they are
+    try:
+        fd = os.open(value, os.O_RDONLY | getattr(os, "O_NONBLOCK", 0))
+    except PermissionError:
+        # Only an error if it names a file we can't read. Other paths (like directories on Windows) are direct input
+        if os.path.isfile(value):
+            PARSER.error("could not read file " + value)
+        return value.strip()
+    except (OSError, ValueError):   # Not a file (missing, invalid name, ...)
+        return value.strip()
+
+    # Only regular files are read, anything else (directories, FIFOs, devices, ...) is direct input
+    if not stat.S_ISREG(os.fstat(fd).st_mode):
+        os.close(fd)
+        return value.strip()
+
+    with os.fdopen(fd, "r") as file:
+        try:
+            return file.read().strip()
+        except (OSError, UnicodeDecodeError):
+            PARSER.error("could not read file " + value)
+
+
+def argument_parser():
+
     # ---------------- PARSE ALL ARGUMENTS ----------------
 
-    args = parser.parse_args()
+    args = PARSER.parse_args()
 
-    # ---------------- DETECT SELECTED TOOL ----------------
+    # ---------------- DETECT SELECTED TOOL AND OPERATION ----------------
 
     SELECTED_TOOL = None
+    SELECTED_OPERATION = None
 
     for name, value in vars(args).items():
-        # Skip non-tool args
-        if name in ["encrypt", "decrypt", "bruteforce", "generate", "info", "text", "key"]:
+        # Skip flags that are not set, and inputs like text or key
+        if not value:
             continue
-        # If the flag is True, select this tool
-        if value:
+
+        category = FLAG_CATEGORY.get(name)
+
+        if category == "tool":
             # If we already have a tool selected, show an error
             if SELECTED_TOOL is None:
                 SELECTED_TOOL = name
             else:
-                parser.error("Must provide only one tool. Use crypto --help")
+                PARSER.error("Must provide only one tool. Use crypto --help")
+
+        # Operations are mutually exclusive in the parser, so at most one can be set
+        elif category == "operation":
+            SELECTED_OPERATION = name
 
     # If no tool was selected, show an error
     if SELECTED_TOOL is None:
-        parser.error("Must provide a tool. Use crypto --help")
-
-    # ---------------- DETECT SELECTED OPERATION ----------------
-
-    SELECTED_OPERATION = None
+        PARSER.error("Must provide a tool. Use crypto --help")
 
-    for name, value in vars(args).items():
-        # Only check operation flags
-        if name in ["encrypt", "decrypt", "bruteforce", "generate", "info"]:
-            if value:
-                SELECTED_OPERATION = name
-
-    # If no operation was selected, show an error
+    # If no operation was selected, default to encrypt
     if SELECTED_OPERATION is None:
         SELECTED_OPERATION = "encrypt"
 
     # --------------- CHECK COMPATIBILITY BETWEEN TOOL/OPERATION ---------------
 
-    if SELECTED_OPERATION not in TOOL_INFO[SELECTED_TOOL]["operations"]:
-        parser.error(
+    if SELECTED_OPERATION not in TOOL_OPERATIONS[SELECTED_TOOL]:
+        PARSER.error(
             "Operation " + SELECTED_OPERATION + " is not compatible with " + SELECTED_TOOL + ". Use crypto --help")
 
     # ---------------- LOAD AND VALIDATE TEXT (-t / --text) ----------------
@@ -112,21 +169,16 @@ def argument_parser():
     # Required for encrypt, decrypt, and bruteforce
     if SELECTED_OPERATION in ["encrypt", "decrypt", "bruteforce"]:
         if args.text is None:
-            parser.error(SELECTED_OPERATION + " requires -t/--text argument")
+            PARSER.error(SELECTED_OPERATION + " requires -t/--text argument")
 
-        # Read from file if it exists, else treat as direct string input
-        if os.path.isfile(args.text):
-            with open(args.text, "r") as file:
-                TEXT = file.read().strip()
-        else:
-            TEXT = str(args.text).strip()
+        TEXT = load_input(args.text)
 
-        # Ensure the text is not purely numeric
-        if TEXT.isdigit():
-            parser.error("-t/--text input must be a string, not a number")
+        # Ensure the text is not purely numeric. The first characters are checked first, so long texts are only fully scanned if they start with digits
+        if TEXT[:64].isdigit() and TEXT.isdigit():
+            PARSER.error("-t/--text input must be a string, not a number")
 
     elif args.text is not None:
-        parser.error(SELECTED_OPERATION + " does not require -t/--text argument")
+        PARSER.error(SELECTED_OPERATION + " does not require -t/--text argument")
 
     # ---------------- LOAD AND VALIDATE KEY (-k / --key) ----------------
 
@@ -135,14 +187,9 @@ def argument_parser():
     # Only required for ciphers that need a key and encrypt/decrypt operations
     if TOOL_INFO[SELECTED_TOOL]["key_type"] is not None and SELECTED_OPERATION in ["encrypt", "decrypt"]:
         if args.key is None:
-            parser.error(SELECTED_TOOL + " cipher requires -k/--key argument")
+            PARSER.error(SELECTED_TOOL + " cipher requires -k/--key argument")
 
-        # Read key from file if it exists, else treat as direct input
-        if os.path.isfile(args.key):
-            with open(args.key, "r") as file:
-                KEY = file.read().strip()
-        else:
-            KEY = str(args.key).strip()
+        KEY = load_input(args.key)
 
         # Try converting to int, else leave as string
         try:
@@ -154,26 +201,32 @@ def argument_parser():
 
     if TOOL_INFO[SELECTED_TOOL]["key_type"] is not None and KEY is not None:  #If we have a needed key
         if TOOL_INFO[SELECTED_TOOL]["key_type"] == "int" and not isinstance(KEY, int):    #If we need int and key isn't we give an error
-            parser.error(SELECTED_TOOL + " tool requires numeric key (-k)")
+            PARSER.error(SELECTED_TOOL + " tool requires numeric key (-k)")
         elif TOOL_INFO[SELECTED_TOOL]["key_type"] == "str" and not isinstance(KEY, str):  #If we need str and key isn't we give an error
-            parser.error(SELECTED_TOOL + " tool requires string key (-k)")
+            PARSER.error(SELECTED_TOOL + " tool requires string key (-k)")
+
+    # ---------------- CHECK SUBSTITUTION KEY ----------------
+
+    # The key must be a full alphabet, checked here so a bad key fails before any text is processed
+    if SELECTED_TOOL == "subst" and KEY is not None and sorted(KEY.lower()) != list(string.ascii_lowercase):
+        PARSER.error(SELECTED_TOOL + " tool requires a 26 letter key using each letter once (-k)")
+
+    # ---------------- CHECK VIGENERE KEY ----------------
+
+    # Each letter of the key is a shift, so it can only contain letters of the alphabet
+    if SELECTED_TOOL == "vigenere" and KEY is not None and not (KEY.isascii() and KEY.isalpha()):
+        PARSER.error(SELECTED_TOOL + " tool requires a key made only of letters (-k)")
 
     # --------------- CALL TOOL FUNCTION WITH PARSED ARGUMENTS ---------------
 
-    if SELECTED_TOOL == "rot":
-        rot.rot(text=TEXT, key=KEY, operation=SELECTED_OPERATION)
-    elif SELECTED_TOOL == "subst":
-        subst.subst(text=TEXT, key=KEY, operation=SELECTED_OPERATION)
-    elif SELECTED_TOOL == "atbash":
-        atbash.atbash(text=TEXT, operation=SELECTED_OPERATION)
-    elif SELECTED_TOOL == "vigenere":
-        vigenere.vigenere(text=TEXT, key=KEY, operation=SELECTED_OPERATION)
-    elif SELECTED_TOOL == "railfence":
-        railfence.railfence(text=TEXT, key=KEY, operation=SELECTED_OPERATION)
-    elif SELECTED_TOOL == "columnar":
-        columnar.columnar(text=TEXT, key=KEY, operation=SELECTED_OPERATION)
-    elif SELECTED_TOOL == "numval":
-        numval.numval(text=TEXT, operation=SELECTED_OPERATION)
+    # Numeric value decryption checks each number while decoding it, so a wrong number is reported here
+    if SELECTED_TOOL == "numval" and SELECTED_OPERATION == "decrypt":
+        try:
+            TOOL_FUNCTIONS[SELECTED_TOOL](TEXT, KEY, SELECTED_OPERATION)
+        except ValueError:
+            PARSER.error(SELECTED_TOOL + " tool requires numbers from 0 to 26 separated by spaces to decrypt (-t)")
+    else:
+        TOOL_FUNCTIONS[SELECTED_TOOL](TEXT, KEY, SELECTED_OPERATION)
 
 
 # --------------------------------------------------------------------------------------------------------------
@@ -1,10 +1,10 @@
-import string, random
+import string
 
 def columnar(text, key, operation):
 
     def columnar_logic_enc(text, key):
 
-        final_text = ""
+        final_text = []
 
         columns = [[] for i in range(len(key))] # Create a list of lists. Each list will represent a column.
         key=list(key.upper())
@@ -15,15 +15,15 @@ def columnar(text, key, operation):
             n += 1
 
         for i in sorted(key): # Go through a sorted list of the key, ordered by the position in the alphabet and join the columns in the same order
-            final_text += "".join(columns[key.index(i)])
+            final_text.extend(columns[key.index(i)])
             columns.pop(key.index(i))
             key.pop(key.index(i))
 
-        return final_text
+        return "".join(final_text)
 
     def columnar_logic_dec(text, key):
 
-        final_text = ""
+        final_text = []
 
         columns = [[] for i in range(len(key))]
         key=list(key.upper())
@@ -41,12 +41,14 @@ def columnar(text, key, operation):
             key=list("".join(key).replace(i,":",1)) # Remove the used letter so duplicates dont overlap
 
         for i in range(len(text)):
-            final_text += columns[i%len(key)][i//len(key)]
+            final_text.append(columns[i%len(key)][i//len(key)])
 
-        return final_text
+        return "".join(final_text)
 
     def columnar_logic_gen():
 
+        import random   # Only needed to generate keys
+
         # Define alphabets and final text variable
         letters = list(string.ascii_uppercase)
         final_text = ""
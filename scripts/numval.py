@@ -1,36 +1,30 @@
 import string
 
+# Token for each byte value: the index of the letter in the alphabet + 1 for A-Z, 0 for a space and None for anything else
+NUMVAL_TOKENS = [str(string.ascii_uppercase.index(chr(byte)) + 1) if chr(byte) in string.ascii_uppercase else None for byte in range(256)]
+NUMVAL_TOKENS[ord(" ")] = "0"
+
 def numval(text, operation):
 
     def numval_logic_enc(text):
 
-        # Define alphabets and final text variable
-        letters = string.ascii_uppercase
-        final_text = ""
-
-        for char in text.upper():
-            if char in letters:
-                final_text += str(letters.index(char)+1) + " "  # Adds the index of the character in the alphabet + 1, followed by a space
-            elif char == " ":
-                final_text += "0 "
-            else:
-                continue
+        # Look up the token of each byte, skipping the characters that have none
+        tokens = [NUMVAL_TOKENS[byte] for byte in text.upper().encode("latin-1", "ignore") if NUMVAL_TOKENS[byte] is not None]
 
-        return final_text
+        return " ".join(tokens) + " " if tokens else ""     # Each token is followed by a space
 
     def numval_logic_dec(text):
 
-        # Define alphabets and final text variable
-        letters = string.ascii_uppercase
-        final_text = ""
+        numbers = text.split()  # Splits the text by spaces, each element is one character
+        final_text = bytearray(len(numbers))    # One byte per character, allocated once
 
-        for char in list(map(int, text.split())):   # Splits the text by spaces and converts each element to int, and puts them in a list
-            if char != 0:
-                final_text += letters[char - 1]
-            else:
-                final_text += " "
+        for i, number in enumerate(numbers):
+            number = int(number)
+            if not 0 <= number <= 26:
+                raise ValueError("numval value out of range (0-26): " + str(number))
+            final_text[i] = 32 if number == 0 else 64 + number  # 0 is a space, 1-26 are the letters A-Z in ASCII
 
-        return final_text
+        return final_text.decode("ascii")
 
 
     if operation == "encrypt":
@@ -1,18 +1,16 @@
-import string, random
+import string, sys
+
+# Set of all the letters, used to strip everything else from the text
+LETTERS_SET = frozenset(string.ascii_letters)
 
 def railfence(text, key, operation):
 
     def railfence_logic_enc(text, key):
 
-        letters_lower = string.ascii_lowercase
-        letters_upper = string.ascii_uppercase
         final_text = ""
 
         #Remove not wanted chars, like spaces or punctuation
-        working_text = ""
-        for char in text:
-            if char in letters_lower or char in letters_upper:
-                working_text += char
+        working_text = "".join(char for char in text if char in LETTERS_SET)
 
         if key == 1: # If theres 1 rail, we just return the text
             return working_text
@@ -34,7 +32,7 @@ def railfence(text, key, operation):
 
     def railfence_logic_dec(text, key):
 
-        final_text = ""
+        final_text = []
 
         if key == 1:
             return text
@@ -67,10 +65,10 @@ def railfence(text, key, operation):
             if pos >= key:
                 pos = cicle - pos
 
-            final_text += rails[pos][pointers[pos]]
+            final_text.append(rails[pos][pointers[pos]])
             pointers[pos] += 1
 
-        return final_text
+        return "".join(final_text)
 
 
     if operation == "encrypt":
@@ -82,11 +80,12 @@ def railfence(text, key, operation):
         return None
 
     if operation == "bruteforce":
-        for i in range(1, len(text)+1):
-            print("Railfence with " + str(i) + " rails: " + railfence_logic_dec(text, i))
+        lines = ["Railfence with " + str(i) + " rails: " + railfence_logic_dec(text, i) for i in range(1, len(text)+1)]
+        sys.stdout.write("".join(line + "\n" for line in lines))    # Writes all the results at once
         return None
 
     if operation == "generate":
+        import random   # Only needed to generate keys
         print(random.randint(1,10))
         return None
 
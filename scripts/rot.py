@@ -1,26 +1,19 @@
-import string, random
+import string, sys
+
+# Translation tables for every possible key, ROT_TABLES[n] moves each letter n times ahead in the alphabet.
+# They are built once so bruteforce only has to translate the text 26 times
+ROT_TABLES = [
+    str.maketrans(
+        string.ascii_lowercase + string.ascii_uppercase,
+        string.ascii_lowercase[n:] + string.ascii_lowercase[:n] + string.ascii_uppercase[n:] + string.ascii_uppercase[:n]
+    )
+    for n in range(26)
+]
 
 def rot(text, key, operation):
 
     def rot_logic(text, key):
-
-        # Define alphabets and final text variable
-        letters_lower = string.ascii_lowercase
-        letters_upper = string.ascii_uppercase
-        final_text = ""
-
-        for char in text:
-            # If the character is in the lower alphabet, move it in the alphabet <key> times ahead
-            if char in letters_lower:
-                final_text += letters_lower[(letters_lower.index(char) + key) % 26]
-            # If the character is in the upper alphabet, move it in the alphabet <key> times ahead
-            elif char in letters_upper:
-                final_text += letters_upper[(letters_upper.index(char) + key) % 26]
-            # If the character is not in the alphabet, add it as is
-            else:
-                final_text += char
-
-        return final_text
+        return text.translate(ROT_TABLES[key % 26])     # Moves each letter <key> times ahead, characters not in the alphabet are left as is
 
 
     if operation == "encrypt":
@@ -32,11 +25,12 @@ def rot(text, key, operation):
         return None
 
     if operation == "bruteforce":
-        for i in range(26):     # Brute forces the text with all possible keys
-            print("ROT " + str(i) + ": " + rot_logic(text, i))
+        lines = ["ROT " + str(i) + ": " + rot_logic(text, i) for i in range(26)]     # Brute forces the text with all possible keys
+        sys.stdout.write("".join(line + "\n" for line in lines))    # Writes all the results at once
         return None
 
     if operation == "generate":
+        import random   # Only needed to generate keys
         print(random.randint(1,26))     # Generates a random key
         return None
 
@@ -1,64 +1,25 @@
-import string, random
+import string
 
 def subst(text, key, operation):
 
     def subst_logic_enc(text, key):
 
-        # Define alphabets and final text variable
-        letters_lower = string.ascii_lowercase
-        letters_upper = string.ascii_uppercase
-        key_lower = key.lower()
-        key_upper = key.upper()
-        final_text = ""
+        # Each letter of the alphabet is replaced by the letter in the same position in the key, characters not in the alphabet are left as is
+        table = str.maketrans(string.ascii_lowercase + string.ascii_uppercase, key.lower() + key.upper())
 
-        for char in text:
-            # If the character is in the lower alphabet, replace it with the corresponding character in the key
-            if char in letters_lower:
-                final_text += key_lower[letters_lower.index(char)]
-            # If the character is in the upper alphabet, replace it with the corresponding character in the key
-            elif char in letters_upper:
-                final_text += key_upper[letters_upper.index(char)]
-            # If the character is not in the alphabet, add it as is
-            else:
-                final_text += char
-
-        return final_text
+        return text.translate(table)
 
     def subst_logic_dec(text, key):
 
-        # Define alphabets and final text variable
-        letters_lower = string.ascii_lowercase
-        letters_upper = string.ascii_uppercase
-        key_lower = key.lower()
-        key_upper = key.upper()
-        final_text = ""
-
-        for char in text:
-            # If the character is in the key, replace it with the corresponding character in the lower alphabet
-            if char in key_lower:
-                final_text += letters_lower[key_lower.index(char)]
-            # If the character is in the key, replace it with the corresponding character in the upper alphabet
-            elif char in key_upper:
-                final_text += letters_upper[key_upper.index(char)]
-            # If the character is not in the key, add it as is
-            else:
-                final_text += char
+        # Each letter of the key is replaced by the letter in the same position in the alphabet, characters not in the key are left as is
+        table = str.maketrans(key.lower() + key.upper(), string.ascii_lowercase + string.ascii_uppercase)
 
-        return final_text
+        return text.translate(table)
 
     def subst_logic_gen():
 
-        # Define alphabets and final text variable
-        letters = list(string.ascii_uppercase)
-        final_text = ""
-
-        # Loop 26 times, each time picking a random letter from the alphabet and removing it from the list
-        for i in range(26):
-            rnd = random.randint(0, len(letters) - 1)
-            final_text += letters[rnd]
-            letters.pop(rnd)
-
-        return final_text
+        import random   # Only needed to generate keys
+        return "".join(random.sample(string.ascii_uppercase, 26))   # Shuffles the alphabet, each letter appears exactly once in the key
 
 
     if operation == "encrypt":
@@ -1,45 +1,42 @@
-import string, random
+import string
+
+# Alphabets and sets of their letters, defined once at module level
+LETTERS_LOWER = string.ascii_lowercase
+LETTERS_UPPER = string.ascii_uppercase
+LETTERS_LOWER_SET = frozenset(LETTERS_LOWER)
+LETTERS_UPPER_SET = frozenset(LETTERS_UPPER)
 
 def vigenere(text, key, operation):
 
     def vigenere_logic_enc(text, key, operation):   # We also input the operation to know if we gotta rotate forwards or backwards.
 
-        # Define alphabets and final text variable
-        letters_lower = string.ascii_lowercase
-        letters_upper = string.ascii_uppercase
-        final_text = ""
+        # Define final text variable
+        final_text = []
+
+        # Shift of each letter of the key, its index in the alphabet. It's negative if we're decrypting, so we rotate backwards
+        shifts = [LETTERS_UPPER.index(letter) for letter in key.upper()]
+        if operation != "encrypt":
+            shifts = [0 - shift for shift in shifts]
 
         n = 0
         for char in text:
-            if char in letters_lower:
-                final_text += letters_lower[
-                    (
-                            letters_lower.index(char) +     # We take the index of the letter in the text
-                            (
-                                letters_upper.index(key.upper()[n]) if operation == "encrypt" else 0 - letters_upper.index(key.upper()[n])  # And add to it the index of the letter in the key in the alphabet, or subtract it if we're decrypting
-                            )
-                    ) % 26
-                ]
-                n = (n + 1) % len(key)  # Add one for next character in the key in the next iteration
-
-            elif char in letters_upper:
-                final_text += letters_upper[
-                    (
-                            letters_upper.index(char) +     # We take the index of the letter in the text
-                            (
-                                letters_upper.index(key.upper()[n]) if operation == "encrypt" else 0 - letters_upper.index(key.upper()[n])  # And add to it the index of the letter in the key in the alphabet, or subtract it if we're decrypting
-                            )
-                    ) % 26
-                ]
-                n = (n + 1) % len(key)  # Add one for next character in the key in the next iteration
+            if char in LETTERS_LOWER_SET:
+                final_text.append(LETTERS_LOWER[(ord(char) - 97 + shifts[n]) % 26])   # Index of the letter in the text, moved by the shift of the letter in the key
+                n = (n + 1) % len(shifts)  # Add one for next character in the key in the next iteration
+
+            elif char in LETTERS_UPPER_SET:
+                final_text.append(LETTERS_UPPER[(ord(char) - 65 + shifts[n]) % 26])   # Index of the letter in the text, moved by the shift of the letter in the key
+                n = (n + 1) % len(shifts)  # Add one for next character in the key in the next iteration
 
             else:
-                final_text += char
+                final_text.append(char)
 
-        return final_text
+        return "".join(final_text)
 
     def vigenere_logic_gen():
 
+        import random   # Only needed to generate keys
+
         # Define alphabets and final text variable
         letters = list(string.ascii_uppercase)
         final_text = ""